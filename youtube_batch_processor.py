@@ -20,8 +20,6 @@ import shutil
 from pathlib import Path
 import json
 import hashlib
-from PIL import Image
-import numpy as np
 from datetime import timedelta
 import textwrap
 import multiprocessing as mp
@@ -29,11 +27,20 @@ from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_compl
 import time
 from typing import List, Tuple, Dict, Optional
 import logging
-from functools import partial
-import asyncio
-import aiofiles
-import threading
-import queue
+
+# PIL is imported lazily inside the methods that decode images so workers
+# that only download/hash/transcribe never pay for loading it (notable
+# under the spawn start method, where every worker re-imports the module)
+
+try:
+    import img2pdf  # optional: lossless JPEG passthrough for PDFs
+except ImportError:
+    img2pdf = None
+
+try:
+    from yt_dlp import YoutubeDL  # optional: in-process metadata extraction
+except ImportError:
+    YoutubeDL = None
 
 # Configure logging
 logging.basicConfig(
@@ -43,12 +50,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; convert_srt_to_text runs these over whole files
+_SRT_TAG_RE = re.compile(r'<[^<]+?>')
+_SRT_BLOCK_RE = re.compile(
+    r'(?:\d+\s*\n)?'         # subtitle index (WebVTT cues may omit it)
+    r'[\d:.,]+\s*-->\s*[\d:.,]+.*\n'  # timestamps (SRT comma or VTT dot ms)
+    r'((?:.+\n?)+?)'         # subtitle text (captured)
+    r'(?:\n|\Z)'             # blank line or end of file
+)
+
 class VideoProcessor:
     """Handles processing of individual videos"""
-    
-    def __init__(self, interval: int, output_dir: str, quality: str = 'high', 
-                 pdf_dpi: int = 300, keep_video: bool = False, 
-                 no_transcript: bool = False, no_pdf: bool = False):
+
+    # Max Hamming distance between two dHashes to count as near-duplicates
+    NEAR_DUP_THRESHOLD = 5
+
+    # Cap extracted frames at create_pdf's page limit so Pillow never has
+    # to LANCZOS-resize them later (YouTube sources rarely exceed this)
+    MAX_DIMENSION = 3000
+    _SCALE_FILTER = (f"scale=w='min(iw\\,{MAX_DIMENSION})':"
+                     f"h='min(ih\\,{MAX_DIMENSION})':"
+                     "force_original_aspect_ratio=decrease")
+
+    # Deletes filesystem-invalid characters in a single C-level pass
+    _SANITIZE_TABLE = str.maketrans('', '', '<>:"/\\|?*')
+
+
+    def __init__(self, interval: int, output_dir: str, quality: str = 'high',
+                 pdf_dpi: int = 300, keep_video: bool = False,
+                 no_transcript: bool = False, no_pdf: bool = False,
+                 fast_seek: bool = False, near_duplicates: bool = False,
+                 stream: bool = False, check_cache: bool = False):
         self.interval = interval
         self.output_dir = output_dir
         self.quality = quality
@@ -56,18 +88,17 @@ class VideoProcessor:
         self.keep_video = keep_video
         self.no_transcript = no_transcript
         self.no_pdf = no_pdf
+        self.fast_seek = fast_seek
+        self.near_duplicates = near_duplicates
+        self.stream = stream
+        self.check_cache = check_cache
     
-    @staticmethod
-    def sanitize_filename(filename: str, max_length: int = 100) -> str:
+    @classmethod
+    def sanitize_filename(cls, filename: str, max_length: int = 100) -> str:
         """Remove invalid characters from filename"""
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '')
-        filename = filename.strip('. ')
-        filename = filename.replace(' ', '_')
-        if len(filename) > max_length:
-            filename = filename[:max_length]
-        return filename
+        return (filename.translate(cls._SANITIZE_TABLE)
+                .strip('. ')
+                .replace(' ', '_')[:max_length])
     
     @staticmethod
     def format_time(seconds: float) -> str:
@@ -77,10 +108,17 @@ class VideoProcessor:
     def get_video_info(self, url: str) -> Optional[Dict]:
         """Get video information using yt-dlp"""
         try:
-            cmd = ['yt-dlp', '--dump-json', '--no-playlist', url]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
-            info = json.loads(result.stdout)
-            
+            if YoutubeDL is not None:
+                # In-process extraction avoids spawning a fresh Python
+                # interpreter (and re-importing yt-dlp) for every URL
+                opts = {'quiet': True, 'no_warnings': True, 'noplaylist': True}
+                with YoutubeDL(opts) as ydl:
+                    info = ydl.extract_info(url, download=False)
+            else:
+                cmd = ['yt-dlp', '--dump-json', '--no-playlist', url]
+                result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=30)
+                info = json.loads(result.stdout)
+
             subtitles_available = bool(info.get('subtitles', {})) or bool(info.get('automatic_captions', {}))
             
             return {
@@ -91,7 +129,7 @@ class VideoProcessor:
                 'view_count': info.get('view_count', 0),
                 'subtitles_available': subtitles_available
             }
-        except (subprocess.CalledProcessError, json.JSONDecodeError, subprocess.TimeoutExpired) as e:
+        except Exception as e:
             logger.error(f"Error getting video info for {url}: {e}")
             return None
     
@@ -119,182 +157,331 @@ class VideoProcessor:
             # Check for transcript
             transcript_found = False
             if transcript_path and not self.no_transcript:
-                video_dir = os.path.dirname(video_path)
-                video_base = os.path.splitext(os.path.basename(video_path))[0]
-                
-                subtitle_patterns = [
-                    f"{video_base}.en.srt",
-                    f"{video_base}.en.vtt",
-                    f"{video_base}.srt",
-                    f"{video_base}.vtt"
-                ]
-                
-                for pattern in subtitle_patterns:
-                    potential_file = os.path.join(video_dir, pattern)
-                    if os.path.exists(potential_file):
-                        self.convert_srt_to_text(potential_file, transcript_path)
-                        transcript_found = True
-                        break
-            
+                transcript_found = self._find_and_convert_subtitle(video_path, transcript_path)
+
             return True, transcript_found
-            
+
         except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
             logger.error(f"Error downloading video: {e}")
             return False, False
+
+    def download_transcript(self, url: str, work_dir: str, transcript_path: str) -> bool:
+        """Fetch and convert subtitles only (used by the streaming path)"""
+        try:
+            base_path = os.path.join(work_dir, 'video.mp4')
+            cmd = [
+                'yt-dlp', '--skip-download', '--no-playlist',
+                '--write-auto-subs', '--write-subs',
+                '--sub-lang', 'en', '--convert-subs', 'srt',
+                '-o', base_path, url
+            ]
+            subprocess.run(cmd, check=True, timeout=120,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return self._find_and_convert_subtitle(base_path, transcript_path)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+            logger.error(f"Error downloading transcript: {e}")
+            return False
+
+    def _find_and_convert_subtitle(self, video_path: str, transcript_path: str) -> bool:
+        """Locate a subtitle file written next to video_path and convert it"""
+        video_dir = os.path.dirname(video_path)
+        video_base = os.path.splitext(os.path.basename(video_path))[0]
+
+        subtitle_patterns = [
+            f"{video_base}.en.srt",
+            f"{video_base}.en.vtt",
+            f"{video_base}.srt",
+            f"{video_base}.vtt"
+        ]
+
+        for pattern in subtitle_patterns:
+            potential_file = os.path.join(video_dir, pattern)
+            if os.path.exists(potential_file):
+                self.convert_srt_to_text(potential_file, transcript_path)
+                return True
+        return False
     
     def convert_srt_to_text(self, srt_file: str, text_file: str) -> bool:
         """Convert SRT subtitle file to plain text"""
         try:
             with open(srt_file, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-            
-            transcript_lines = []
-            current_text = []
-            
-            for line in lines:
-                line = line.strip()
-                if line and not line.isdigit() and '-->' not in line:
-                    line = re.sub('<[^<]+?>', '', line)
-                    current_text.append(line)
-                elif not line and current_text:
-                    transcript_lines.append(' '.join(current_text))
-                    current_text = []
-            
-            if current_text:
-                transcript_lines.append(' '.join(current_text))
-            
+                data = f.read()
+
+            # One finditer sweep over the whole file; whitespace is
+            # normalized per block via split/join, so no second regex
+            # pass over the joined text is needed
+            transcript_lines = [
+                ' '.join(_SRT_TAG_RE.sub('', match.group(1)).split())
+                for match in _SRT_BLOCK_RE.finditer(data)
+            ]
+
             with open(text_file, 'w', encoding='utf-8') as f:
                 f.write("VIDEO TRANSCRIPT\n")
                 f.write("=" * 50 + "\n\n")
-                full_text = ' '.join(transcript_lines)
-                full_text = re.sub(r'\s+', ' ', full_text)
-                wrapped_text = textwrap.fill(full_text, width=80)
+                wrapped_text = textwrap.fill(' '.join(transcript_lines), width=80)
                 f.write(wrapped_text)
-            
+
             return True
         except Exception as e:
             logger.error(f"Error converting transcript: {e}")
             return False
     
     def extract_screenshots(self, video_path: str, output_dir: str, title_prefix: str) -> List[str]:
-        """Extract screenshots from video"""
+        """Extract screenshots from video in a single ffmpeg pass
+
+        With fast_seek enabled only keyframes are decoded, so screenshot
+        timestamps snap to the nearest keyframe at or after each interval.
+        """
         try:
             os.makedirs(output_dir, exist_ok=True)
-            
-            # Get video duration
+
+            # One decode pass with the fps filter instead of one ffmpeg
+            # process (startup + container open + seek) per screenshot;
+            # ffmpeg stops at EOF, so no duration probe is needed
+            ext = 'png' if self.quality == 'highest' else 'jpg'
+            pattern = os.path.join(output_dir, f"{title_prefix}_%06d.{ext}")
+            if self.fast_seek:
+                # Decode only keyframes and select one per interval; for
+                # interval >> GOP size this skips nearly all P/B frames
+                select_expr = (
+                    "select='isnan(prev_selected_t)"
+                    f"+gte(t-prev_selected_t\\,{self.interval})'"
+                )
+                cmd = [
+                    'ffmpeg', '-skip_frame', 'nokey', '-i', video_path,
+                    '-vsync', 'vfr',
+                    '-vf', f'{select_expr},{self._SCALE_FILTER}',
+                    '-start_number', '0',
+                ]
+            else:
+                cmd = [
+                    'ffmpeg', '-i', video_path,
+                    '-vf', f'fps=1/{self.interval},{self._SCALE_FILTER}',
+                    '-start_number', '0',
+                ]
+            if ext == 'jpg':
+                cmd.extend(['-q:v', '1'])
+            cmd.extend(['-y', pattern])
+
+            subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, check=True)
+
+            return self._collect_and_rename(output_dir, title_prefix, ext)
+
+        except Exception as e:
+            logger.error(f"Error extracting screenshots: {e}")
+            return []
+
+    def stream_extract_screenshots(self, url: str, output_dir: str,
+                                   title_prefix: str) -> List[str]:
+        """Pipe the yt-dlp download straight into ffmpeg, skipping the video file
+
+        Avoids writing (and re-reading) gigabytes of intermediate video;
+        only usable when the video itself doesn't need to be kept.
+        """
+        downloader = None
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+
+            ext = 'png' if self.quality == 'highest' else 'jpg'
+            pattern = os.path.join(output_dir, f"{title_prefix}_%06d.{ext}")
+
+            downloader = subprocess.Popen(
+                ['yt-dlp', '-f', 'best[ext=mp4]/best', '--no-playlist',
+                 '-o', '-', url],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
             cmd = [
-                'ffprobe', '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                video_path
+                'ffmpeg', '-i', 'pipe:0',
+                '-vf', f'fps=1/{self.interval},{self._SCALE_FILTER}',
+                '-start_number', '0',
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            duration = float(result.stdout.strip())
-            
-            screenshot_files = []
-            current_time = 0
-            
-            while current_time <= duration:
-                time_str = f"{int(current_time):04d}s"
-                
-                if self.quality == 'highest':
-                    output_file = os.path.join(output_dir, f"{title_prefix}_{time_str}.png")
-                    cmd = [
-                        'ffmpeg', '-ss', str(current_time),
-                        '-i', video_path, '-vframes', '1',
-                        '-vf', 'scale=iw:ih', '-y', output_file
-                    ]
-                else:
-                    output_file = os.path.join(output_dir, f"{title_prefix}_{time_str}.jpg")
-                    cmd = [
-                        'ffmpeg', '-ss', str(current_time),
-                        '-i', video_path, '-vframes', '1',
-                        '-q:v', '1', '-vf', 'scale=iw:ih',
-                        '-y', output_file
-                    ]
-                
-                subprocess.run(cmd, stdout=subprocess.DEVNULL, 
-                             stderr=subprocess.DEVNULL, check=True)
-                screenshot_files.append(output_file)
-                current_time += self.interval
-            
-            return screenshot_files
-            
+            if ext == 'jpg':
+                cmd.extend(['-q:v', '1'])
+            cmd.extend(['-y', pattern])
+
+            subprocess.run(cmd, stdin=downloader.stdout,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           check=True, timeout=600)
+            downloader.stdout.close()
+            if downloader.wait() != 0:
+                logger.warning(f"yt-dlp exited non-zero while streaming {url}")
+
+            return self._collect_and_rename(output_dir, title_prefix, ext)
+
         except Exception as e:
-            logger.error(f"Error extracting screenshots: {e}")
+            logger.error(f"Error stream-extracting screenshots: {e}")
+            if downloader is not None:
+                downloader.kill()
             return []
+
+    def _collect_and_rename(self, output_dir: str, title_prefix: str,
+                            ext: str) -> List[str]:
+        """Rename ffmpeg's sequential frame numbers to timestamp-based names"""
+        frame_re = re.compile(re.escape(title_prefix) + r'_(\d{6})\.' + ext + '$')
+        produced = []
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                match = frame_re.match(entry.name)
+                if match:
+                    produced.append((int(match.group(1)), entry.path))
+
+        screenshot_files = []
+        for idx, raw_path in sorted(produced):
+            time_str = f"{idx * self.interval:04d}s"
+            final_path = os.path.join(output_dir, f"{title_prefix}_{time_str}.{ext}")
+            os.replace(raw_path, final_path)
+            screenshot_files.append(final_path)
+
+        return screenshot_files
     
+    @staticmethod
+    def _dhash(path: str) -> int:
+        """64-bit difference hash: 9x8 grayscale, horizontal gradient bits"""
+        from PIL import Image
+        with Image.open(path) as img:
+            pixels = list(img.convert('L').resize((9, 8), Image.BILINEAR).getdata())
+        bits = 0
+        for row in range(8):
+            for col in range(8):
+                bits = (bits << 1) | (pixels[row * 9 + col] < pixels[row * 9 + col + 1])
+        return bits
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        """Hash a file's bytes for duplicate detection (non-cryptographic use)"""
+        hasher = hashlib.blake2b(digest_size=16)
+        # 64 KB chunks keep the working set cache-resident instead of
+        # allocating the whole file as one bytes object
+        with open(path, 'rb', buffering=0) as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
     def remove_duplicates(self, screenshot_files: List[str]) -> int:
         """Remove duplicate screenshots"""
         if len(screenshot_files) <= 1:
             return 0
-        
+
+        # Bucket by file size first: files of different size can't be
+        # identical, and singleton buckets are skipped without hashing
+        by_size: Dict[int, List[str]] = {}
+        for path in screenshot_files:
+            if os.path.exists(path):
+                by_size.setdefault(os.path.getsize(path), []).append(path)
+
+        # Hash the multi-file buckets in parallel; file reads and hashing
+        # both release the GIL, so this overlaps I/O with compute
+        to_hash = [path for paths in by_size.values() if len(paths) >= 2
+                   for path in paths]
+        hashes = {}
+        if to_hash:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                hashes = dict(zip(to_hash, executor.map(self._hash_file, to_hash)))
+
         duplicates_removed = 0
-        files_to_remove = set()
-        processed_hashes = {}
-        
-        for current_file in screenshot_files:
-            if current_file in files_to_remove or not os.path.exists(current_file):
+        for paths in by_size.values():
+            if len(paths) < 2:
                 continue
-            
-            with open(current_file, 'rb') as f:
-                current_hash = hashlib.sha256(f.read()).hexdigest()
-            
-            if current_hash in processed_hashes:
-                files_to_remove.add(current_file)
-            else:
-                processed_hashes[current_hash] = current_file
-        
-        for file_path in files_to_remove:
+            seen = {}
+            for path in paths:
+                current_hash = hashes[path]
+                if current_hash in seen:
+                    try:
+                        os.remove(path)
+                        duplicates_removed += 1
+                    except Exception:
+                        pass
+                else:
+                    seen[current_hash] = path
+
+        # Optional perceptual pass: catch frames that differ only by
+        # encoder noise, which byte-exact hashing never matches
+        if self.near_duplicates:
+            kept_hashes: List[int] = []
+            for path in screenshot_files:
+                if not os.path.exists(path):
+                    continue
+                try:
+                    current_dhash = self._dhash(path)
+                except Exception:
+                    continue
+                if any(bin(current_dhash ^ kept).count('1') <= self.NEAR_DUP_THRESHOLD
+                       for kept in kept_hashes):
+                    try:
+                        os.remove(path)
+                        duplicates_removed += 1
+                    except Exception:
+                        pass
+                else:
+                    kept_hashes.append(current_dhash)
+
+        return duplicates_removed
+    
+    @staticmethod
+    def _list_images(images_dir: str) -> List[str]:
+        """List screenshot files with one directory scan, sorted by name"""
+        with os.scandir(images_dir) as entries:
+            return sorted(entry.path for entry in entries
+                          if entry.is_file() and entry.name.endswith(('.jpg', '.png')))
+
+    @classmethod
+    def _iter_pdf_images(cls, image_files):
+        """Lazily open and convert images so only one page is decoded at a time"""
+        from PIL import Image
+        for img_path in image_files:
             try:
-                os.remove(file_path)
-                duplicates_removed += 1
+                with Image.open(img_path) as img:
+                    img.load()
+                    page = img.convert('RGB') if img.mode != 'RGB' else img.copy()
+
+                # Extraction already caps frames at MAX_DIMENSION, so this
+                # only fires for images that predate the scale filter
+                if page.width > cls.MAX_DIMENSION or page.height > cls.MAX_DIMENSION:
+                    page.thumbnail((cls.MAX_DIMENSION, cls.MAX_DIMENSION),
+                                   Image.Resampling.LANCZOS)
+
+                yield page
             except Exception:
                 pass
-        
-        return duplicates_removed
-    
+
     def create_pdf(self, images_dir: str, pdf_path: str) -> bool:
         """Create PDF from images"""
         if self.no_pdf:
             return False
-        
+
         try:
-            image_files = sorted(list(Path(images_dir).glob('*.jpg')) + 
-                               list(Path(images_dir).glob('*.png')))
-            
+            image_files = self._list_images(images_dir)
+
             if not image_files:
                 return False
-            
-            pdf_images = []
-            for img_path in image_files:
-                try:
-                    img = Image.open(img_path)
-                    if img.mode != 'RGB':
-                        img = img.convert('RGB')
-                    
-                    max_dimension = 3000
-                    if img.width > max_dimension or img.height > max_dimension:
-                        img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
-                    
-                    pdf_images.append(img)
-                except Exception:
-                    pass
-            
-            if pdf_images:
-                pdf_images[0].save(
+
+            # Fast path: embed the original JPEG bytes into the PDF with
+            # no decode/re-encode cycle, preserving quality exactly
+            if img2pdf is not None and all(p.endswith('.jpg') for p in image_files):
+                layout = img2pdf.get_fixed_dpi_layout_fun((self.pdf_dpi, self.pdf_dpi))
+                with open(pdf_path, 'wb') as f:
+                    f.write(img2pdf.convert(image_files, layout_fun=layout))
+                return True
+
+            # Stream pages into the PDF writer instead of holding every
+            # decoded image in memory until save()
+            pages = self._iter_pdf_images(image_files)
+            first_page = next(pages, None)
+            if first_page is not None:
+                first_page.save(
                     pdf_path, "PDF",
                     resolution=self.pdf_dpi,
                     quality=95,
                     optimize=True,
                     save_all=True,
-                    append_images=pdf_images[1:] if len(pdf_images) > 1 else []
+                    append_images=pages
                 )
                 return True
-            
+
         except Exception as e:
             logger.error(f"Error creating PDF: {e}")
-        
+
         return False
     
     def process_video(self, url: str, job_id: int) -> Dict:
@@ -308,7 +495,8 @@ class VideoProcessor:
             'duration': 0,
             'screenshots': 0,
             'pdf_created': False,
-            'transcript_saved': False
+            'transcript_saved': False,
+            'cached': False
         }
         
         try:
@@ -322,28 +510,54 @@ class VideoProcessor:
             # Setup directories
             safe_title = self.sanitize_filename(video_info['title'])
             video_dir = Path(self.output_dir) / safe_title
+
+            # Idempotency check: skip videos whose PDF already exists
+            if self.check_cache and not self.no_pdf:
+                pdf_path = video_dir / f"{safe_title}_HD.pdf"
+                if pdf_path.exists():
+                    logger.info(f"[Job {job_id}] Output PDF exists, skipping: {video_info['title']}")
+                    result['success'] = True
+                    result['cached'] = True
+                    result['pdf_created'] = True
+                    return result
+
             images_dir = video_dir / 'images'
             images_dir.mkdir(parents=True, exist_ok=True)
             
-            with tempfile.TemporaryDirectory() as temp_dir:
+            # Keep the temp dir on the same filesystem as the output so a
+            # kept video can be renamed into place instead of copied
+            with tempfile.TemporaryDirectory(dir=self.output_dir) as temp_dir:
                 video_path = os.path.join(temp_dir, 'video.mp4')
                 transcript_path = video_dir / f"{safe_title}_transcript.txt"
-                
-                # Download video
-                logger.info(f"[Job {job_id}] Downloading: {video_info['title']}")
-                video_success, transcript_success = self.download_video(
-                    url, video_path, transcript_path if not self.no_transcript else None
-                )
-                
-                if not video_success:
-                    result['error'] = "Failed to download video"
-                    return result
-                
-                result['transcript_saved'] = transcript_success
-                
-                # Extract screenshots
-                logger.info(f"[Job {job_id}] Extracting screenshots...")
-                screenshot_files = self.extract_screenshots(video_path, images_dir, safe_title)
+
+                if self.stream and not self.keep_video:
+                    # Streaming path: pipe the download into ffmpeg without
+                    # touching disk; subtitles need their own (cheap) fetch
+                    if not self.no_transcript:
+                        result['transcript_saved'] = self.download_transcript(
+                            url, temp_dir, transcript_path
+                        )
+
+                    logger.info(f"[Job {job_id}] Streaming + extracting: {video_info['title']}")
+                    screenshot_files = self.stream_extract_screenshots(
+                        url, images_dir, safe_title
+                    )
+                else:
+                    # Download video
+                    logger.info(f"[Job {job_id}] Downloading: {video_info['title']}")
+                    video_success, transcript_success = self.download_video(
+                        url, video_path, transcript_path if not self.no_transcript else None
+                    )
+
+                    if not video_success:
+                        result['error'] = "Failed to download video"
+                        return result
+
+                    result['transcript_saved'] = transcript_success
+
+                    # Extract screenshots
+                    logger.info(f"[Job {job_id}] Extracting screenshots...")
+                    screenshot_files = self.extract_screenshots(video_path, images_dir, safe_title)
                 
                 if screenshot_files:
                     # Remove duplicates
@@ -358,7 +572,9 @@ class VideoProcessor:
                     # Keep video if requested
                     if self.keep_video:
                         final_video_path = video_dir / f"{safe_title}.mp4"
-                        shutil.copy2(video_path, final_video_path)
+                        # The temp dir is about to be deleted anyway, so a
+                        # move (rename on the same FS) avoids a full copy
+                        shutil.move(video_path, final_video_path)
                     
                     result['success'] = True
                     logger.info(f"[Job {job_id}] ✓ Completed: {video_info['title']}")
@@ -373,11 +589,33 @@ class VideoProcessor:
         return result
 
 
-def process_video_wrapper(args: Tuple) -> Dict:
-    """Wrapper function for multiprocessing"""
-    url, job_id, processor_params = args
-    processor = VideoProcessor(**processor_params)
-    return processor.process_video(url, job_id)
+# Shared worker pool, created lazily and reused across batches so repeat
+# invocations don't pay worker spawn + import cost again. Each worker
+# builds its VideoProcessor once in the initializer rather than per task.
+_WORKER_POOL: Optional[ProcessPoolExecutor] = None
+_WORKER_PROCESSOR: Optional[VideoProcessor] = None
+
+
+def _init_worker(processor_params: Dict):
+    """Per-worker setup: pre-import heavy modules, build one VideoProcessor"""
+    import PIL.Image  # noqa: F401
+    global _WORKER_PROCESSOR
+    _WORKER_PROCESSOR = VideoProcessor(**processor_params)
+
+
+def _process_video_task(url: str, job_id: int) -> Dict:
+    """Run one video through the worker's long-lived VideoProcessor"""
+    return _WORKER_PROCESSOR.process_video(url, job_id)
+
+
+def get_worker_pool(max_workers: int, processor_params: Dict) -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use"""
+    global _WORKER_POOL
+    if _WORKER_POOL is None:
+        _WORKER_POOL = ProcessPoolExecutor(max_workers=max_workers,
+                                           initializer=_init_worker,
+                                           initargs=(processor_params,))
+    return _WORKER_POOL
 
 
 class BatchProcessor:
@@ -393,43 +631,38 @@ class BatchProcessor:
         logger.info(f"Starting batch processing of {len(self.urls)} videos")
         logger.info(f"Using {self.num_workers} parallel workers")
         
-        # Prepare arguments for each job
-        job_args = [
-            (url, idx + 1, self.processor_params) 
-            for idx, url in enumerate(self.urls)
-        ]
-        
         results = []
         start_time = time.time()
-        
-        # Use ProcessPoolExecutor for CPU-bound tasks
-        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
-            # Submit all jobs
-            futures = {
-                executor.submit(process_video_wrapper, args): args[1] 
-                for args in job_args
-            }
-            
-            # Process completed jobs
-            completed = 0
-            for future in as_completed(futures):
-                job_id = futures[future]
-                try:
-                    result = future.result(timeout=600)  # 10 min timeout per video
-                    results.append(result)
-                    completed += 1
-                    
-                    # Progress update
-                    progress = (completed / len(self.urls)) * 100
-                    logger.info(f"Progress: {completed}/{len(self.urls)} ({progress:.1f}%)")
-                    
-                except Exception as e:
-                    logger.error(f"Job {job_id} failed: {e}")
-                    results.append({
-                        'job_id': job_id,
-                        'success': False,
-                        'error': str(e)
-                    })
+
+        # Use the shared process pool; it stays warm for any further batches
+        executor = get_worker_pool(self.num_workers, self.processor_params)
+
+        # Submit all jobs
+        futures = {
+            executor.submit(_process_video_task, url, idx + 1): idx + 1
+            for idx, url in enumerate(self.urls)
+        }
+
+        # Process completed jobs
+        completed = 0
+        for future in as_completed(futures):
+            job_id = futures[future]
+            try:
+                result = future.result(timeout=600)  # 10 min timeout per video
+                results.append(result)
+                completed += 1
+
+                # Progress update
+                progress = (completed / len(self.urls)) * 100
+                logger.info(f"Progress: {completed}/{len(self.urls)} ({progress:.1f}%)")
+
+            except Exception as e:
+                logger.error(f"Job {job_id} failed: {e}")
+                results.append({
+                    'job_id': job_id,
+                    'success': False,
+                    'error': str(e)
+                })
         
         total_time = time.time() - start_time
         
@@ -495,13 +728,18 @@ def check_dependencies() -> bool:
         'ffprobe': 'ffprobe -version'
     }
     
-    missing = []
-    for tool, cmd in dependencies.items():
+    def probe(cmd):
         try:
             subprocess.run(cmd.split(), capture_output=True, check=True)
+            return True
         except (subprocess.CalledProcessError, FileNotFoundError):
-            missing.append(tool)
-    
+            return False
+
+    # The version probes are independent processes; run them concurrently
+    with ThreadPoolExecutor(max_workers=len(dependencies)) as executor:
+        results = executor.map(probe, dependencies.values())
+    missing = [tool for tool, found in zip(dependencies, results) if not found]
+
     try:
         import PIL
         import numpy
@@ -517,8 +755,10 @@ def check_dependencies() -> bool:
         print("\nInstallation instructions:")
         print("  Ubuntu/Debian: sudo apt-get install ffmpeg && pip install yt-dlp Pillow numpy")
         print("  macOS: brew install ffmpeg && pip install yt-dlp Pillow numpy")
+        print("\nOptional (faster image resizing for PDFs):")
+        print("  pip uninstall -y pillow && pip install pillow-simd")
         return False
-    
+
     return True
 
 
@@ -547,6 +787,17 @@ def main():
                        help='Skip transcript download')
     parser.add_argument('--no-pdf', action='store_true',
                        help='Skip PDF generation')
+    parser.add_argument('--check-cache', action='store_true',
+                       help='Skip videos whose output PDF already exists')
+    parser.add_argument('--stream', action='store_true',
+                       help='Pipe the download directly into ffmpeg instead of '
+                            'saving the video first (ignored with --keep-video)')
+    parser.add_argument('--near-dup', action='store_true',
+                       help='Also remove visually near-identical screenshots '
+                            'using a perceptual hash')
+    parser.add_argument('--fast-seek', action='store_true',
+                       help='Decode only keyframes for faster extraction '
+                            '(timestamps snap to nearest keyframe)')
     parser.add_argument('--workers', type=int, default=0,
                        help='Number of parallel workers (default: number of CPU cores)')
     
@@ -585,7 +836,11 @@ def main():
         'pdf_dpi': args.pdf_dpi,
         'keep_video': args.keep_video,
         'no_transcript': args.no_transcript,
-        'no_pdf': args.no_pdf
+        'no_pdf': args.no_pdf,
+        'fast_seek': args.fast_seek,
+        'near_duplicates': args.near_dup,
+        'stream': args.stream,
+        'check_cache': args.check_cache
     }
     
     # Process videos
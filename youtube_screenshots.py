@@ -17,28 +17,46 @@ Features:
 import os
 import sys
 import re
+import glob
 import subprocess
 import argparse
 import tempfile
-import shutil
 from pathlib import Path
+from collections import defaultdict
 import json
 import hashlib
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image
 import numpy as np
 from datetime import timedelta
 import textwrap
 
+# Optional: in-process metadata extraction without spawning a second
+# interpreter (the download itself stays a subprocess for its CLI flags)
+try:
+    from yt_dlp import YoutubeDL
+except ImportError:
+    YoutubeDL = None
+
+# Optional: embeds JPEG/PNG bytes into the PDF without re-encoding
+try:
+    import img2pdf
+except ImportError:
+    img2pdf = None
+
+# Optional: tiled, SIMD image downscaling for very large screenshots
+try:
+    import pyvips
+except ImportError:
+    pyvips = None
+
+# Deletion table for characters that are invalid in filenames
+_SANITIZE_TBL = str.maketrans('', '', '<>:"/\\|?*')
+
 def sanitize_filename(filename, max_length=100):
     """Remove invalid characters from filename"""
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '')
-    filename = filename.strip('. ')
-    filename = filename.replace(' ', '_')
-    if len(filename) > max_length:
-        filename = filename[:max_length]
-    return filename
+    return filename.translate(_SANITIZE_TBL).strip('. ').replace(' ', '_')[:max_length]
 
 def format_time(seconds):
     """Convert seconds to readable format"""
@@ -53,7 +71,8 @@ def debug_available_formats(url):
             '--no-playlist',
             url
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True,
+                                text=True, check=True)
         print("\n🔍 DEBUG: All available formats:")
         print("=" * 60)
         print(result.stdout)
@@ -68,16 +87,32 @@ def get_video_info(url, debug_formats=False):
     try:
         if debug_formats:
             debug_available_formats(url)
-        
-        cmd = [
-            'yt-dlp',
-            '--dump-json',
-            '--no-playlist',
-            url
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        info = json.loads(result.stdout)
-        
+
+        if YoutubeDL is not None:
+            # Calling the library directly avoids forking a second
+            # interpreter and re-importing yt-dlp's module tree
+            with YoutubeDL({'quiet': True, 'no_warnings': True,
+                            'noplaylist': True}) as ydl:
+                info = ydl.sanitize_info(ydl.extract_info(url, download=False))
+            raw_info = json.dumps(info)
+        else:
+            cmd = [
+                'yt-dlp',
+                '--dump-json',
+                '--no-playlist',
+                url
+            ]
+            result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True,
+                                    text=True, check=True)
+            raw_info = result.stdout
+            info = json.loads(raw_info)
+
+        # Persist the raw metadata so the download step can replay it with
+        # --load-info-json instead of querying YouTube a second time
+        info_fd, info_json_path = tempfile.mkstemp(suffix='.info.json')
+        with os.fdopen(info_fd, 'w', encoding='utf-8') as f:
+            f.write(raw_info)
+
         # Check for available subtitles/captions
         subtitles_available = bool(info.get('subtitles', {})) or bool(info.get('automatic_captions', {}))
         
@@ -125,7 +160,8 @@ def get_video_info(url, debug_formats=False):
             'view_count': info.get('view_count', 0),
             'subtitles_available': subtitles_available,
             'hd_formats': hd_formats,
-            'all_formats': all_formats
+            'all_formats': all_formats,
+            'info_json': info_json_path
         }
     except subprocess.CalledProcessError as e:
         print(f"Error getting video info: {e}")
@@ -133,9 +169,19 @@ def get_video_info(url, debug_formats=False):
     except json.JSONDecodeError as e:
         print(f"Error parsing video info: {e}")
         return None
+    except Exception as e:
+        # yt-dlp's API raises its own DownloadError hierarchy
+        print(f"Error getting video info: {e}")
+        return None
 
-def download_video_and_transcript(url, video_path, transcript_path, force_hd=True):
-    """Download YouTube video and transcript/subtitles using yt-dlp with aggressive HD quality forcing"""
+def download_video_and_transcript(url, video_path, transcript_path, force_hd=True,
+                                  info_json=None):
+    """Download YouTube video and transcript/subtitles using yt-dlp with aggressive HD quality forcing
+
+    When info_json points at a metadata dump from get_video_info(), it is
+    replayed via --load-info-json so the download skips the second
+    metadata round-trip to YouTube (and is deleted once consumed).
+    """
     try:
         if force_hd:
             # AGGRESSIVE HD FORCING - Try multiple strategies
@@ -171,30 +217,26 @@ def download_video_and_transcript(url, video_path, transcript_path, force_hd=Tru
             '--write-subs',       # Download manual subtitles if available
             '--sub-lang', 'en',   # Prefer English subtitles
             '--convert-subs', 'srt',  # Convert to SRT format
-            url
+            '--progress-delta', '1',  # At most one progress render per second
         ]
-        
+
+        if info_json and os.path.exists(info_json):
+            cmd += ['--load-info-json', info_json]
+        else:
+            cmd.append(url)
+
         print("Downloading video and attempting to fetch transcript...")
         subprocess.run(cmd, check=True)
         
-        # Check if subtitle file was created
-        video_dir = os.path.dirname(video_path)
-        video_base = os.path.splitext(os.path.basename(video_path))[0]
-        
-        # Look for subtitle files
-        subtitle_patterns = [
-            f"{video_base}.en.srt",
-            f"{video_base}.en.vtt",
-            f"{video_base}.srt",
-            f"{video_base}.vtt"
-        ]
-        
-        subtitle_file = None
-        for pattern in subtitle_patterns:
-            potential_file = os.path.join(video_dir, pattern)
-            if os.path.exists(potential_file):
-                subtitle_file = potential_file
-                break
+        # Look for subtitle files with one directory scan per extension
+        # (covers video.en.srt, video.srt, etc.), preferring SRT. The stem
+        # must be escaped: titles like "... [Official Video]" would
+        # otherwise turn into glob character classes and never match
+        video_file = Path(video_path)
+        stem = glob.escape(video_file.stem)
+        candidates = (sorted(video_file.parent.glob(stem + '*.srt')) +
+                      sorted(video_file.parent.glob(stem + '*.vtt')))
+        subtitle_file = str(candidates[0]) if candidates else None
         
         # If subtitle file exists, convert to plain text
         if subtitle_file:
@@ -208,42 +250,46 @@ def download_video_and_transcript(url, video_path, transcript_path, force_hd=Tru
     except subprocess.CalledProcessError as e:
         print(f"Error downloading video: {e}")
         return False, False
+    finally:
+        if info_json and os.path.exists(info_json):
+            os.remove(info_json)
+
+# Compiled once; convert_srt_to_text applies these per line / per file
+_TAG_RE = re.compile(r'<[^<]+?>')
+_WS_RE = re.compile(r'\s+')
+
+def _subtitle_blocks(lines):
+    """Yield the joined text of each SRT subtitle block
+
+    Sequence numbers, timestamp lines and markup tags are dropped; an
+    empty line terminates a block. The single reused buffer keeps the
+    pass at one block's worth of allocation.
+    """
+    buf = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            if buf:
+                yield ' '.join(buf)
+                buf.clear()
+        elif not line.isdigit() and '-->' not in line:
+            buf.append(_TAG_RE.sub('', line))
+    if buf:
+        yield ' '.join(buf)
 
 def convert_srt_to_text(srt_file, text_file):
     """Convert SRT subtitle file to plain text transcript"""
     try:
         with open(srt_file, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-        
-        transcript_lines = []
-        current_text = []
-        
-        for line in lines:
-            line = line.strip()
-            # Skip subtitle numbers and timestamps
-            if line and not line.isdigit() and '-->' not in line:
-                # Remove HTML tags if present
-                line = re.sub('<[^<]+?>', '', line)
-                current_text.append(line)
-            elif not line and current_text:
-                # Empty line indicates end of subtitle block
-                transcript_lines.append(' '.join(current_text))
-                current_text = []
-        
-        # Add any remaining text
-        if current_text:
-            transcript_lines.append(' '.join(current_text))
-        
+            # Single pass: blocks stream out of the generator into one
+            # join, then one whitespace-normalization sweep
+            full_text = _WS_RE.sub(' ', ' '.join(_subtitle_blocks(f)))
+
         # Write to text file
         with open(text_file, 'w', encoding='utf-8') as f:
             f.write("VIDEO TRANSCRIPT\n")
             f.write("=" * 50 + "\n\n")
-            
-            # Join lines and format paragraphs
-            full_text = ' '.join(transcript_lines)
-            # Remove duplicate spaces
-            full_text = re.sub(r'\s+', ' ', full_text)
-            
+
             # Wrap text for better readability
             wrapped_text = textwrap.fill(full_text, width=80)
             f.write(wrapped_text)
@@ -255,39 +301,255 @@ def convert_srt_to_text(srt_file, text_file):
         print(f"Error converting transcript: {e}")
         return False
 
-def extract_high_quality_screenshots(video_path, output_dir, interval, title_prefix, quality='high'):
-    """Extract maximum quality screenshots from video with aggressive HD settings"""
+def _probe_video(video_path):
+    """Fetch resolution, codec, bitrate and duration in one ffprobe call"""
+    cmd = [
+        'ffprobe',
+        '-v', 'error',
+        '-select_streams', 'v:0',
+        '-show_entries', 'stream=width,height,codec_name,bit_rate:format=duration',
+        '-of', 'json',
+        video_path
+    ]
+    result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True,
+                            text=True, check=True)
+    info = json.loads(result.stdout)
+    stream = (info.get('streams') or [{}])[0]
+    fmt = info.get('format', {})
+    return {
+        'width': stream.get('width'),
+        'height': stream.get('height'),
+        'codec_name': stream.get('codec_name'),
+        'bit_rate': stream.get('bit_rate'),
+        'duration': float(fmt['duration']) if fmt.get('duration') else 0.0
+    }
+
+def _run_quiet(cmd):
+    """Run an ffmpeg/ffprobe command silently, detached from the terminal
+
+    stdin is closed so the child can never block waiting on TTY input
+    (ffmpeg reads stdin for interactive commands by default).
+    """
+    subprocess.run(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True
+    )
+
+# Byte markers used to split individual frames out of an image2pipe stream
+_JPEG_EOI = b'\xff\xd9'
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+def _split_piped_frames(stream, codec):
+    """Yield complete encoded frames from an ffmpeg image2pipe byte stream"""
+    buffer = bytearray()
+    while True:
+        chunk = stream.read(1 << 20)
+        if not chunk:
+            break
+        buffer.extend(chunk)
+
+        if codec == 'mjpeg':
+            # Each JPEG ends with the EOI marker
+            while True:
+                end = buffer.find(_JPEG_EOI)
+                if end == -1:
+                    break
+                yield bytes(buffer[:end + 2])
+                del buffer[:end + 2]
+        else:
+            # Each PNG starts with the signature; a frame is complete once
+            # the next signature arrives (the final one flushes at EOF)
+            while True:
+                next_start = buffer.find(_PNG_SIGNATURE, len(_PNG_SIGNATURE))
+                if next_start == -1:
+                    break
+                yield bytes(buffer[:next_start])
+                del buffer[:next_start]
+
+    if codec != 'mjpeg' and buffer.startswith(_PNG_SIGNATURE):
+        yield bytes(buffer)
+
+def _extract_screenshots_piped(video_path, output_dir, interval, title_prefix,
+                               quality, duration, ffmpeg_dedup=False,
+                               dedup_in_stream=False):
+    """Single-pass extraction: one ffmpeg decode, frames read from stdout
+
+    With ffmpeg_dedup, an mpdecimate filter drops visually near-identical
+    frames inside ffmpeg, so duplicates never touch the disk or Python;
+    file names then reflect capture order rather than exact timestamps.
+
+    With dedup_in_stream, frames whose encoded bytes repeat an earlier
+    frame are dropped before ever being written, saving the write-then-
+    delete round-trip for static scenes.
+
+    Returns the list of written files, or None if the piped pass failed
+    and the caller should fall back to per-timestamp extraction.
+    """
+    if quality == 'high':
+        ext, codec = 'jpg', 'mjpeg'
+        codec_opts = ['-q:v', '1', '-qmin', '1', '-qmax', '1']
+    else:
+        ext, codec = 'png', 'png'
+        # Fast zlib setting: still lossless, far smaller than level 0
+        # and quicker to write than the default
+        codec_opts = ['-compression_level', '1']
+
+    video_filter = f'fps=1/{interval}'
+    if ffmpeg_dedup:
+        video_filter += ',mpdecimate=hi=64*12:lo=64*5:frac=0.33'
+        codec_opts = codec_opts + ['-vsync', 'vfr']
+
+    cmd = [
+        'ffmpeg',
+        '-i', video_path,
+        '-vf', video_filter,
+    ] + codec_opts + [
+        '-f', 'image2pipe',
+        '-vcodec', codec,
+        '-'
+    ]
+
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=1 << 20
+        )
+
+        screenshot_files = []
+        seen_digests = set()
+        for idx, frame in enumerate(_split_piped_frames(proc.stdout, codec)):
+            current_time = idx * interval
+
+            if dedup_in_stream:
+                digest = hashlib.blake2b(frame, digest_size=16).digest()
+                if digest in seen_digests:
+                    continue
+                seen_digests.add(digest)
+
+            time_str = f"{int(current_time):04d}s"
+            output_file = os.path.join(output_dir, f"{title_prefix}_{time_str}.{ext}")
+            with open(output_file, 'wb') as f:
+                f.write(frame)
+            screenshot_files.append(output_file)
+
+            # One carriage-return render per 25 frames keeps progress
+            # visible without a write syscall per screenshot
+            if duration > 0 and len(screenshot_files) % 25 == 0:
+                progress = (current_time / duration) * 100
+                sys.stdout.write(
+                    f"\r  [{progress:5.1f}%] {len(screenshot_files)} screenshots saved")
+                sys.stdout.flush()
+
+        proc.stdout.close()
+        if proc.wait() != 0 or not screenshot_files:
+            return None
+
+        print(f"\r  [100.0%] {len(screenshot_files)} screenshots saved")
+        return screenshot_files
+
+    except Exception as e:
+        print(f"  Piped extraction failed ({e}), falling back to per-frame seeks")
+        return None
+
+def _extract_screenshots_per_frame(video_path, output_dir, interval,
+                                   title_prefix, quality, duration):
+    """Fallback: spawn one fast-seeking ffmpeg process per timestamp
+
+    Uses keyframe-aligned input seeking (-noaccurate_seek before -i), so
+    each frame may snap to the nearest keyframe; audio/subtitle/data
+    streams are never demuxed. The independent per-timestamp seeks run
+    concurrently on a thread pool.
+    """
+    jobs = []
+    for current_time in range(0, int(duration) + 1, interval):
+        time_str = f"{current_time:04d}s"
+
+        # Always use PNG for maximum quality by default, unless specifically requesting JPEG
+        if quality == 'high':
+            # High quality JPEG with maximum settings
+            output_file = os.path.join(output_dir, f"{title_prefix}_{time_str}.jpg")
+            cmd = [
+                'ffmpeg',
+                '-hide_banner', '-loglevel', 'error',
+                '-noaccurate_seek',
+                '-ss', str(current_time),
+                '-i', video_path,
+                '-an', '-sn', '-dn',  # Video only: skip audio/sub/data demux
+                '-threads', '1',  # One decoder thread per job; the pool supplies parallelism
+                '-vframes', '1',
+                '-q:v', '1',  # Maximum JPEG quality
+                '-qmin', '1',  # Minimum quantizer
+                '-qmax', '1',  # Maximum quantizer (same as min for consistent quality)
+                '-pix_fmt', 'yuvj444p',  # Highest quality pixel format for JPEG
+                '-y',
+                output_file
+            ]
+        else:
+            # Lossless PNG for absolute maximum quality
+            output_file = os.path.join(output_dir, f"{title_prefix}_{time_str}.png")
+            cmd = [
+                'ffmpeg',
+                '-hide_banner', '-loglevel', 'error',
+                '-noaccurate_seek',
+                '-ss', str(current_time),
+                '-i', video_path,
+                '-an', '-sn', '-dn',  # Video only: skip audio/sub/data demux
+                '-threads', '1',  # One decoder thread per job; the pool supplies parallelism
+                '-vframes', '1',
+                '-pix_fmt', 'rgb24',  # RGB for PNG
+                '-compression_level', '1',  # Fast deflate; PNG stays lossless
+                '-y',
+                output_file
+            ]
+
+        jobs.append((output_file, cmd))
+
+    def _run_job(job):
+        output_file, cmd = job
+        _run_quiet(cmd)
+        return output_file
+
+    # Each job is a lightweight single-frame ffmpeg process, so threads
+    # are enough to keep all cores busy
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        screenshot_files = list(executor.map(_run_job, jobs))
+
+    print(f"  Extracted {len(screenshot_files)} screenshots via parallel seeks")
+
+    return screenshot_files
+
+def extract_high_quality_screenshots(video_path, output_dir, interval, title_prefix,
+                                     quality='high', ffmpeg_dedup=False, duration=0,
+                                     dedup_in_stream=False):
+    """Extract maximum quality screenshots from video with aggressive HD settings
+
+    By default all frames come from a single ffmpeg decode pass piped
+    over stdout, avoiding one process spawn and container open/seek per
+    screenshot; per-timestamp seeking remains as a fallback.
+
+    duration comes from the yt-dlp metadata when available; ffprobe is
+    only consulted for it as a last resort.
+    """
     try:
         os.makedirs(output_dir, exist_ok=True)
-        
-        # Get video resolution
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-select_streams', 'v:0',
-            '-show_entries', 'stream=width,height',
-            '-of', 'csv=p=0',
-            video_path
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        resolution_info = result.stdout.strip().split(',')
-        
-        # Get video duration
-        cmd2 = [
-            'ffprobe',
-            '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            video_path
-        ]
-        result2 = subprocess.run(cmd2, capture_output=True, text=True, check=True)
-        duration = float(result2.stdout.strip())
-        
-        if len(resolution_info) >= 2:
-            width, height = int(resolution_info[0]), int(resolution_info[1])
+
+        # One probe covers resolution and, if the yt-dlp metadata had
+        # no duration, the duration fallback as well
+        probe = _probe_video(video_path)
+        if not duration:
+            duration = probe['duration']
+
+        if probe['width'] and probe['height']:
+            width, height = probe['width'], probe['height']
             print(f"Video resolution: {width}x{height}")
             print(f"Video duration: {duration:.1f} seconds")
-            
+
             # Check if video is HD quality and warn if not
             if height >= 1080:
                 print(f"✓ Full HD video detected ({height}p) - Excellent quality expected")
@@ -297,66 +559,20 @@ def extract_high_quality_screenshots(video_path, output_dir, interval, title_pre
                 print(f"⚠ Video quality is below HD ({height}p) - Consider finding a higher quality source")
         else:
             print(f"Video duration: {duration:.1f} seconds")
-        
+
         print(f"Extracting maximum quality screenshots every {interval} seconds...")
-        
-        screenshots_taken = 0
-        current_time = 0
-        screenshot_files = []
-        
-        while current_time <= duration:
-            time_str = f"{int(current_time):04d}s"
-            
-            # Always use PNG for maximum quality by default, unless specifically requesting JPEG
-            if quality == 'high':
-                # High quality JPEG with maximum settings
-                output_file = os.path.join(output_dir, f"{title_prefix}_{time_str}.jpg")
-                cmd = [
-                    'ffmpeg',
-                    '-ss', str(current_time),
-                    '-i', video_path,
-                    '-vframes', '1',
-                    '-q:v', '1',  # Maximum JPEG quality
-                    '-qmin', '1',  # Minimum quantizer
-                    '-qmax', '1',  # Maximum quantizer (same as min for consistent quality)
-                    '-vf', 'scale=iw:ih:flags=lanczos+accurate_rnd+full_chroma_int',  # Best scaling
-                    '-pix_fmt', 'yuvj444p',  # Highest quality pixel format for JPEG
-                    '-y',
-                    output_file
-                ]
-            else:
-                # Lossless PNG for absolute maximum quality
-                output_file = os.path.join(output_dir, f"{title_prefix}_{time_str}.png")
-                cmd = [
-                    'ffmpeg',
-                    '-ss', str(current_time),
-                    '-i', video_path,
-                    '-vframes', '1',
-                    '-vf', 'scale=iw:ih:flags=lanczos+accurate_rnd+full_chroma_int',  # Best scaling
-                    '-pix_fmt', 'rgb24',  # RGB for PNG
-                    '-compression_level', '0',  # No compression for maximum quality
-                    '-y',
-                    output_file
-                ]
-            
-            subprocess.run(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=True
+
+        screenshot_files = _extract_screenshots_piped(
+            video_path, output_dir, interval, title_prefix, quality, duration,
+            ffmpeg_dedup=ffmpeg_dedup, dedup_in_stream=dedup_in_stream
+        )
+        if screenshot_files is None:
+            screenshot_files = _extract_screenshots_per_frame(
+                video_path, output_dir, interval, title_prefix, quality, duration
             )
-            
-            screenshots_taken += 1
-            screenshot_files.append(output_file)
-            
-            # Show progress
-            progress = (current_time / duration) * 100
-            print(f"  [{progress:5.1f}%] Screenshot at {format_time(current_time)} saved")
-            
-            current_time += interval
-        
-        return screenshots_taken, screenshot_files
-        
+
+        return len(screenshot_files), screenshot_files
+
     except subprocess.CalledProcessError as e:
         print(f"Error extracting screenshots: {e}")
         return 0, []
@@ -364,130 +580,132 @@ def extract_high_quality_screenshots(video_path, output_dir, interval, title_pre
         print(f"Error parsing video duration: {e}")
         return 0, []
 
+# Digest cache keyed by (path, mtime, size): repeat hashing of files
+# that have not changed between passes is answered from memory
+_HASH_CACHE = {}
+
 def get_image_hash(image_path):
     """Calculate hash of an image for comparison"""
     try:
+        stat = os.stat(image_path)
+        cache_key = (image_path, stat.st_mtime_ns, stat.st_size)
+        cached = _HASH_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # BLAKE2b is the fastest stdlib hash on 64-bit hosts and a
+        # 128-bit digest is ample for duplicate detection; hashing the
+        # mmap lets the kernel stream pages straight into the hasher
+        # with no intermediate userspace buffer
         with open(image_path, 'rb') as f:
-            return hashlib.sha256(f.read()).hexdigest()
+            hasher = hashlib.blake2b(digest_size=16)
+            if os.fstat(f.fileno()).st_size:  # mmap rejects empty files
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+            digest = hasher.hexdigest()
+
+        _HASH_CACHE[cache_key] = digest
+        return digest
     except Exception as e:
         print(f"Error hashing image {image_path}: {e}")
         return None
 
-def are_images_identical(img1_path, img2_path):
-    """Check if two images are identical"""
+# Max Hamming distance between two perceptual hashes for screenshots to
+# count as duplicates; byte-identical frames always land at distance 0
+HAMMING_THRESHOLD = 5
+
+def perceptual_hash(image_path):
+    """64-bit difference hash: 9x8 grayscale, horizontal gradient bits"""
     try:
-        hash1 = get_image_hash(img1_path)
-        hash2 = get_image_hash(img2_path)
-        
-        if hash1 and hash2 and hash1 == hash2:
-            return True
-        
-        img1 = Image.open(img1_path)
-        img2 = Image.open(img2_path)
-        
-        if img1.mode != 'RGB':
-            img1 = img1.convert('RGB')
-        if img2.mode != 'RGB':
-            img2 = img2.convert('RGB')
-        
-        if img1.size != img2.size:
-            return False
-        
-        arr1 = np.array(img1)
-        arr2 = np.array(img2)
-        
-        return np.array_equal(arr1, arr2)
-        
+        with Image.open(image_path) as img:
+            small = img.convert('L').resize((9, 8), Image.BILINEAR)
+        arr = np.asarray(small, dtype=np.int16)
+        bits = (arr[:, 1:] > arr[:, :-1]).flatten()
+        return int.from_bytes(np.packbits(bits).tobytes(), 'big')
     except Exception as e:
-        print(f"Error comparing images: {e}")
-        return False
+        print(f"Error hashing image {image_path}: {e}")
+        return None
+
+# Bit counts for every byte value; indexing with a uint8 array gives a
+# vectorized popcount
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
 
 def remove_duplicate_screenshots(screenshot_files):
-    """Remove duplicate screenshots"""
+    """Remove duplicate and visually near-identical screenshots
+
+    Each screenshot is reduced to a 64-bit perceptual fingerprint and
+    compared to the already-kept frames by Hamming distance, so frames
+    that differ only by encoder noise are caught without ever decoding
+    two full-resolution images side by side.
+    """
     if len(screenshot_files) <= 1:
         return 0
-    
+
     print("\nRemoving duplicate screenshots...")
-    
+
     duplicates_removed = 0
-    files_to_remove = set()
-    processed_hashes = {}
-    
-    for i, current_file in enumerate(screenshot_files):
-        if current_file in files_to_remove:
-            continue
-        
-        if not os.path.exists(current_file):
-            continue
-        
-        current_hash = get_image_hash(current_file)
-        if not current_hash:
-            continue
-        
-        if current_hash in processed_hashes:
-            files_to_remove.add(current_file)
-        else:
-            processed_hashes[current_hash] = current_file
-            
-            for j in range(i + 1, len(screenshot_files)):
-                compare_file = screenshot_files[j]
-                
-                if compare_file in files_to_remove or not os.path.exists(compare_file):
-                    continue
-                
-                if are_images_identical(current_file, compare_file):
-                    files_to_remove.add(compare_file)
-    
-    if len(files_to_remove) > 0:
-        print(f"  Removing {len(files_to_remove)} duplicate images...")
-        for file_path in files_to_remove:
+
+    # Fingerprint computation is dominated by decode/disk time, so it
+    # parallelizes well on threads; only the keep/remove decision below
+    # is order-dependent
+    existing_files = [f for f in screenshot_files if os.path.exists(f)]
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        file_hashes = list(executor.map(perceptual_hash, existing_files))
+
+    hashed = [(f, h) for f, h in zip(existing_files, file_hashes) if h is not None]
+    if not hashed:
+        return 0
+
+    # All fingerprints packed into one N x 8 byte matrix: Hamming
+    # distances against every kept frame come from a single vectorized
+    # XOR plus table-lookup popcount instead of a Python loop
+    fingerprints = np.array(
+        [np.frombuffer(h.to_bytes(8, 'big'), dtype=np.uint8) for _, h in hashed])
+
+    kept_rows = []
+    kept_exact = set()
+
+    for row, (current_file, current_hash) in enumerate(hashed):
+        # Exact fingerprint repeats (identical frames) resolve via set
+        # lookup; only genuinely new hashes pay for the Hamming scan
+        is_duplicate = current_hash in kept_exact
+        if not is_duplicate and kept_rows:
+            distances = _POPCOUNT[fingerprints[kept_rows] ^ fingerprints[row]].sum(axis=1)
+            is_duplicate = bool(distances.min() <= HAMMING_THRESHOLD)
+
+        if is_duplicate:
             try:
-                os.remove(file_path)
+                os.remove(current_file)
                 duplicates_removed += 1
             except Exception as e:
-                print(f"  Error removing {file_path}: {e}")
-    
+                print(f"  Error removing {current_file}: {e}")
+        else:
+            kept_rows.append(row)
+            kept_exact.add(current_hash)
+
+    if duplicates_removed > 0:
+        print(f"  Removed {duplicates_removed} duplicate images")
+
     return duplicates_removed
 
 def verify_downloaded_video_quality(video_path):
     """Verify the quality of the downloaded video"""
     try:
-        # Get video resolution
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-select_streams', 'v:0',
-            '-show_entries', 'stream=width,height',
-            '-of', 'csv=p=0',
-            video_path
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        resolution_info = result.stdout.strip().split(',')
-        
-        # Get codec and bitrate separately
-        cmd2 = [
-            'ffprobe',
-            '-v', 'error',
-            '-select_streams', 'v:0',
-            '-show_entries', 'stream=codec_name,bit_rate',
-            '-of', 'csv=p=0',
-            video_path
-        ]
-        result2 = subprocess.run(cmd2, capture_output=True, text=True, check=True)
-        codec_info = result2.stdout.strip().split(',')
-        
-        if len(resolution_info) >= 2:
-            width, height = int(resolution_info[0]), int(resolution_info[1])
+        # Resolution, codec and bitrate all come from one ffprobe spawn
+        probe = _probe_video(video_path)
+
+        if probe['width'] and probe['height']:
+            width, height = probe['width'], probe['height']
             print(f"\n📹 Downloaded video quality verification:")
             print(f"   Resolution: {width}x{height}")
-            
+
             # Add codec info if available
-            if len(codec_info) >= 1 and codec_info[0]:
-                print(f"   Codec: {codec_info[0]}")
-            
+            if probe['codec_name']:
+                print(f"   Codec: {probe['codec_name']}")
+
             # Add bitrate info if available
-            if len(codec_info) >= 2 and codec_info[1] and codec_info[1].isdigit():
-                bitrate = int(codec_info[1])
+            if probe['bit_rate'] and str(probe['bit_rate']).isdigit():
+                bitrate = int(probe['bit_rate'])
                 print(f"   Bitrate: {bitrate/1000:.0f} kbps")
             
             if height >= 1080:
@@ -506,75 +724,114 @@ def verify_downloaded_video_quality(video_path):
         print(f"   Error verifying video quality: {e}")
         return "unknown"
 
+def _list_screenshots(images_dir):
+    """Sorted screenshot paths from a single directory scan"""
+    with os.scandir(images_dir) as it:
+        return sorted(e.path for e in it if e.name.endswith(('.jpg', '.png')))
+
+def _iter_pdf_pages(image_files):
+    """Lazily decode screenshots for PDF assembly, one page at a time
+
+    Yielding from a generator keeps a single decoded frame resident
+    while PIL's PDF writer consumes the stream, instead of holding every
+    RGB page in memory until the final save.
+    """
+    for img_path in image_files:
+        try:
+            img = Image.open(img_path)
+
+            # Convert to RGB if necessary, but preserve quality
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+
+            # Don't resize - keep original resolution for maximum quality
+            # Only resize if absolutely massive (over 4K)
+            max_dimension = 4000  # Allow up to 4K resolution
+            if img.width > max_dimension or img.height > max_dimension:
+                print(f"    Resizing very large image: {img.width}x{img.height}")
+                if pyvips is not None:
+                    # libvips streams the decode tile by tile through a
+                    # SIMD resize, peaking near the output size in RAM
+                    # instead of ~2x the full decoded input
+                    img.close()
+                    small = pyvips.Image.thumbnail(str(img_path), max_dimension)
+                    arr = np.frombuffer(small.write_to_memory(), dtype=np.uint8)
+                    img = Image.fromarray(
+                        arr.reshape(small.height, small.width, small.bands))
+                    if img.mode != 'RGB':
+                        img = img.convert('RGB')
+                else:
+                    img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+
+            yield img
+
+        except Exception as e:
+            print(f"  Warning: Could not process {img_path}: {e}")
+
 def create_hd_pdf_images_only(images_dir, pdf_path, video_info, dpi=600):
     """Create maximum quality PDF from images only with enhanced settings"""
     try:
         print(f"\nCreating maximum quality PDF (DPI: {dpi})...")
-        
+
         # Get all image files
-        image_files = sorted(list(Path(images_dir).glob('*.jpg')) + list(Path(images_dir).glob('*.png')))
-        
+        image_files = _list_screenshots(images_dir)
+
         if not image_files:
             print("  No images found to create PDF")
             return False
-        
+
         print(f"  Found {len(image_files)} images to include in PDF")
-        
-        # Prepare images for PDF with maximum quality settings
-        pdf_images = []
-        
-        # Add all screenshots with quality preservation
-        print("  Processing screenshots for maximum PDF quality...")
-        for i, img_path in enumerate(image_files):
+
+        # Fast path: img2pdf embeds the original encoded bytes directly
+        # into the PDF container - no decode, no lossy re-encode
+        if img2pdf is not None:
             try:
-                img = Image.open(img_path)
-                
-                # Convert to RGB if necessary, but preserve quality
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Don't resize - keep original resolution for maximum quality
-                # Only resize if absolutely massive (over 4K)
-                max_dimension = 4000  # Allow up to 4K resolution
-                if img.width > max_dimension or img.height > max_dimension:
-                    print(f"    Resizing very large image: {img.width}x{img.height}")
-                    img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
-                
-                pdf_images.append(img)
-                
-                if (i + 1) % 5 == 0:
-                    print(f"    Processed {i + 1}/{len(image_files)} images...")
-                    
+                layout = img2pdf.get_fixed_dpi_layout_fun((dpi, dpi))
+                with open(pdf_path, 'wb') as f:
+                    f.write(img2pdf.convert([str(p) for p in image_files],
+                                            layout_fun=layout))
+
+                file_size = os.path.getsize(pdf_path) / (1024 * 1024)
+                print(f"  ✅ Maximum quality PDF created (img2pdf passthrough)!")
+                print(f"    - Screenshots: {len(image_files)}")
+                print(f"    - DPI: {dpi}")
+                print(f"    - Size: {file_size:.2f} MB")
+                print(f"    - Quality: Original bytes, no re-encoding")
+                print(f"    - Location: {pdf_path}")
+                return True
             except Exception as e:
-                print(f"  Warning: Could not process {img_path}: {e}")
-        
-        # Save as maximum quality PDF
+                print(f"  img2pdf failed ({e}), falling back to PIL writer")
+
+        # Stream pages into the PDF writer with maximum quality settings
         print(f"  Saving maximum quality PDF...")
-        
-        if pdf_images:
-            # Save with maximum quality settings
-            pdf_images[0].save(
+        pages = _iter_pdf_pages(image_files)
+        first_page = next(pages, None)
+
+        if first_page is not None:
+            # Save with maximum quality settings; remaining pages are
+            # decoded on demand as the writer pulls them
+            first_page.save(
                 pdf_path,
                 "PDF",
                 resolution=dpi,  # High DPI for better quality
                 quality=100,  # Maximum quality setting
                 optimize=False,  # Don't optimize to preserve quality
                 save_all=True,
-                append_images=pdf_images[1:] if len(pdf_images) > 1 else []
+                append_images=pages
             )
-            
+
             # Get file size
             file_size = os.path.getsize(pdf_path) / (1024 * 1024)
-            
+
             print(f"  ✅ Maximum quality PDF created!")
             print(f"    - Screenshots: {len(image_files)}")
             print(f"    - DPI: {dpi}")
             print(f"    - Size: {file_size:.2f} MB")
             print(f"    - Quality: Maximum (no compression)")
             print(f"    - Location: {pdf_path}")
-            
+
             return True
-        
+
     except Exception as e:
         print(f"  Error creating PDF: {e}")
         return False
@@ -586,21 +843,38 @@ def verify_all_unique(images_dir):
     print("\nVerifying all images are unique...")
     
     # Get all image files in the directory
-    image_files = sorted([str(f) for f in Path(images_dir).glob('*.jpg')] + 
-                         [str(f) for f in Path(images_dir).glob('*.png')])
-    
+    image_files = _list_screenshots(images_dir)
+
     if len(image_files) <= 1:
         print("  ✓ Only one or no images present - uniqueness guaranteed!")
         return True
     
     print(f"  Checking {len(image_files)} images...")
-    
+
+    # Files of different sizes cannot be byte-identical, so a stat-only
+    # bucketing pass removes most files from the hash workload entirely
+    by_size = defaultdict(list)
+    for img_path in image_files:
+        try:
+            by_size[os.path.getsize(img_path)].append(img_path)
+        except OSError:
+            continue
+    candidates = [p for group in by_size.values() if len(group) > 1 for p in group]
+
+    if not candidates:
+        print(f"  ✓ All {len(image_files)} images are unique!")
+        return True
+
     # Store hashes of all images
     image_hashes = {}
     duplicates_found = []
-    
-    for img_path in image_files:
-        img_hash = get_image_hash(img_path)
+
+    # hashlib releases the GIL on large updates, so hashing overlaps
+    # across threads and with disk reads
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        computed_hashes = list(executor.map(get_image_hash, candidates))
+
+    for img_path, img_hash in zip(candidates, computed_hashes):
         if img_hash:
             if img_hash in image_hashes:
                 # Found a duplicate
@@ -624,13 +898,18 @@ def check_dependencies():
         'ffprobe': 'ffprobe -version'
     }
     
-    missing = []
-    for tool, cmd in dependencies.items():
+    def probe(cmd):
         try:
             subprocess.run(cmd.split(), capture_output=True, check=True)
+            return True
         except (subprocess.CalledProcessError, FileNotFoundError):
-            missing.append(tool)
-    
+            return False
+
+    # The version probes are independent processes; run them concurrently
+    with ThreadPoolExecutor(max_workers=len(dependencies)) as executor:
+        results = executor.map(probe, dependencies.values())
+    missing = [tool for tool, found in zip(dependencies, results) if not found]
+
     try:
         import PIL
         import numpy
@@ -638,6 +917,12 @@ def check_dependencies():
         print("\nError: Missing required Python packages.")
         print("Please install: pip install Pillow numpy")
         return False
+    else:
+        # Pillow-SIMD versions carry a .postN suffix; plain Pillow can be
+        # swapped for it (same API) for ~4-6x faster resize/decode paths
+        if 'post' not in getattr(PIL, '__version__', ''):
+            print("Tip: 'pip install pillow-simd' (replacing Pillow) speeds up "
+                  "PDF image processing on SSE4/AVX2 CPUs")
     
     if missing:
         print("Error: Missing required dependencies:")
@@ -660,6 +945,10 @@ def main():
     parser.add_argument('--force-local-hd', action='store_true', help='Force download and keep HD video locally for maximum quality')
     parser.add_argument('--output-dir', default='.', help='Base directory for output')
     parser.add_argument('--no-duplicate-removal', action='store_true', help='Disable duplicate removal')
+    parser.add_argument('--ffmpeg-dedup', action='store_true',
+                       help='Drop near-identical frames inside ffmpeg (mpdecimate) '
+                            'so duplicates are never written; skips the Python '
+                            'dedup pass and names files by capture order')
     parser.add_argument('--no-pdf', action='store_true', help='Skip PDF generation')
     parser.add_argument('--no-transcript', action='store_true', help='Skip transcript download')
     parser.add_argument('--quality', choices=['high', 'highest'], default='highest', 
@@ -715,7 +1004,13 @@ def main():
     images_dir.mkdir(parents=True, exist_ok=True)
     
     with tempfile.TemporaryDirectory() as temp_dir:
-        video_path = os.path.join(temp_dir, 'video.mp4')
+        # When the video is kept, download straight to its final home
+        # instead of copying a multi-GB file out of the temp dir later
+        keep_video = args.keep_video or args.force_local_hd
+        if keep_video:
+            video_path = str(video_dir / f"{safe_title}.mp4")
+        else:
+            video_path = os.path.join(temp_dir, 'video.mp4')
         transcript_path = video_dir / f"{safe_title}_transcript.txt"
         
         # Download video and transcript with HD forcing
@@ -723,7 +1018,8 @@ def main():
             args.url, 
             video_path, 
             transcript_path if not args.no_transcript else None,
-            force_hd=True
+            force_hd=True,
+            info_json=video_info.get('info_json')
         )
         
         if not video_success:
@@ -746,18 +1042,23 @@ def main():
         # Extract high-quality screenshots
         print(f"\nExtracting {args.quality} quality screenshots...")
         screenshot_count, screenshot_files = extract_high_quality_screenshots(
-            video_path, 
-            images_dir, 
+            video_path,
+            images_dir,
             args.interval,
             safe_title,
-            args.quality
+            args.quality,
+            ffmpeg_dedup=args.ffmpeg_dedup,
+            duration=video_info.get('duration') or 0,
+            # Exact repeats never hit the disk when dedup is on; the
+            # perceptual pass afterwards still catches near-duplicates
+            dedup_in_stream=not args.no_duplicate_removal and not args.ffmpeg_dedup
         )
         
         if screenshot_count > 0:
             print(f"\n✓ Extracted {screenshot_count} screenshots")
             
-            # Remove duplicates
-            if not args.no_duplicate_removal:
+            # Remove duplicates (already handled in-stream with --ffmpeg-dedup)
+            if not args.no_duplicate_removal and not args.ffmpeg_dedup:
                 duplicates_removed = remove_duplicate_screenshots(screenshot_files)
                 if duplicates_removed > 0:
                     print(f"✓ Removed {duplicates_removed} duplicate screenshots")
@@ -779,10 +1080,10 @@ def main():
                 if not pdf_created:
                     print("\n⚠ Warning: PDF creation failed")
             
-            # Keep video if requested or force local HD
-            if args.keep_video or args.force_local_hd:
-                final_video_path = video_dir / f"{safe_title}.mp4"
-                shutil.copy2(video_path, final_video_path)
+            # Keep video if requested or force local HD (already at its
+            # final path, nothing to copy)
+            if keep_video:
+                final_video_path = Path(video_path)
                 if args.force_local_hd:
                     print(f"\n📹 HD Video stored locally: {final_video_path.absolute()}")
                     print(f"   Use this local file for maximum quality screenshots in future")
@@ -801,18 +1102,17 @@ def main():
                 print(f"📝 Transcript (text file): {transcript_path.absolute()}")
             
             # List some of the final files
-            remaining_files = sorted(list(Path(images_dir).glob('*.jpg')) + 
-                                    list(Path(images_dir).glob('*.png')))
+            remaining_files = _list_screenshots(images_dir)
             if remaining_files:
                 print(f"\nTotal unique screenshots: {len(remaining_files)}")
                 if len(remaining_files) <= 5:
                     print("Files:")
                     for f in remaining_files:
-                        print(f"  - {f.name}")
+                        print(f"  - {os.path.basename(f)}")
                 else:
                     print("Sample files:")
                     for f in remaining_files[:3]:
-                        print(f"  - {f.name}")
+                        print(f"  - {os.path.basename(f)}")
                     print(f"  ... and {len(remaining_files) - 3} more")
             
             print(f"{'='*60}\n")